@@ -74,4 +74,7 @@ Frontends
 """
 FRONTEND_HOST = ENV.get("FRONTEND_HOST", "127.0.0.1")
 FRONTEND_PORT = ENV.get("FRONTEND_PORT", "8501")
+FRONTEND_DEBUG = ENV.get("FRONTEND_DEBUG", "False").lower() == "true"
 KEEP_RESPONSES = 10
+REQUEST_TIMEOUT = 30
+RESPONSE_STREAMING_THRESHOLD = 1024 * 1024
@@ -6,13 +6,35 @@
 ****************************************************
 """
 import os
-from typing import Optional, List
-import requests
-import json
+from typing import Optional, List, Any, Tuple
+import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
 from http.client import responses as status_codes
+from http.cookiejar import DefaultCookiePolicy
 from src.configuration import configuration as cfg
-from src.utility.bronze import requests_utility, json_utility, time_utility
+from src.utility.bronze import json_utility, time_utility
+
+
+IO_POOL = ThreadPoolExecutor(max_workers=1)
+STREAMING_CHUNK_SIZE = 64 * 1024
+RESPONSE_PREVIEW_SIZE = 4 * 1024
+STATUS_DESCRIPTIONS = {
+    code: f"Status description: {description}" for code, description in status_codes.items()}
+
+
+def get_frontend_cache_path(force_default: bool = False) -> str:
+    """
+    Function for preparing the frontend folders and acquiring the path of the state cache to load.
+    :param force_default: Flag for declaring, whether to force loading the default cache.
+    :return: Frontend cache path.
+    """
+    os.makedirs(cfg.PATHS.RESPONSE_PATH, exist_ok=True)
+    if os.path.exists(cfg.PATHS.FRONTEND_CACHE) and not force_default:
+        return cfg.PATHS.FRONTEND_CACHE
+    else:
+        return cfg.PATHS.FRONTEND_DEFAULT_CACHE
 
 
 def populate_or_get_frontend_cache(force_default: bool = False) -> dict:
@@ -21,14 +43,7 @@ def populate_or_get_frontend_cache(force_default: bool = False) -> dict:
     :param force_default: Flag for declaring, whether to force loading the default cache.
     :return: Frontend cache.
     """
-    if not os.path.exists(cfg.PATHS.RESPONSE_PATH):
-        os.makedirs(cfg.PATHS.RESPONSE_PATH)
-    if os.path.exists(cfg.PATHS.FRONTEND_CACHE) and not force_default:
-        return json_utility.load(
-            cfg.PATHS.FRONTEND_CACHE)
-    else:
-        return json_utility.load(
-            cfg.PATHS.FRONTEND_DEFAULT_CACHE)
+    return json_utility.load(get_frontend_cache_path(force_default=force_default))
 
 
 def save_frontend_cache(cache_data: dict, ignore: List[str] = [], output_path: str = None) -> None:
@@ -44,6 +59,33 @@ def save_frontend_cache(cache_data: dict, ignore: List[str] = [], output_path: s
     ) if key not in ignore}, cfg.PATHS.FRONTEND_CACHE if output_path is None else output_path)
 
 
+def _write_cache_file(content: bytes, path: str) -> float:
+    """
+    Function for writing serialized cache data.
+    :param content: Serialized cache data.
+    :param path: Output path.
+    :return: Modification time of the written file.
+    """
+    json_utility.write(content, path)
+    return os.path.getmtime(path)
+
+
+def save_frontend_cache_in_background(cache_data: dict, ignore: List[str] = [], output_path: str = None) -> Future:
+    """
+    Function for saving state cache in the background.
+    The cache is serialized on the calling thread with the standard json module, only the disk write is deferred.
+    :param cache_data: Cache data.
+    :param ignore: List of keys to ignore.
+        Defaults to empty list.
+    :param output_path: Output path.
+        Defaults to None in wich case the standard output path is used.
+    :return: Future of the disk write, resolving to the modification time of the written file.
+    """
+    content = json_utility.serialize({key: value for key, value in cache_data.items(
+    ) if key not in ignore})
+    return IO_POOL.submit(_write_cache_file, content, cfg.PATHS.FRONTEND_CACHE if output_path is None else output_path)
+
+
 def dump_frontend_cache(cache_data: dict, ignore: List[str] = [], output_path: str = None) -> None:
     """
     Function for dumping state cache.
@@ -58,14 +100,65 @@ def dump_frontend_cache(cache_data: dict, ignore: List[str] = [], output_path: s
                         ignore=ignore, output_path=output_path)
 
 
+def get_response_file_path(response_name: str, extension: str = ".json") -> str:
+    """
+    Function for acquiring the path of a response file.
+    :param response_name: Response name.
+    :param extension: File extension.
+        Defaults to ".json" for the response data file.
+    :return: Response file path.
+    """
+    return f"{cfg.PATHS.RESPONSE_PATH}{os.sep}{response_name}{extension}"
+
+
+def save_response_file(response_data: dict) -> None:
+    """
+    Function for saving response file.
+    Streamed response content is moved next to the response file.
+    Response data is written with the standard json module to keep large integers and NaN values unchanged.
+    :param response_data: Response data, including the response name.
+    """
+    if response_data.get("response_file") is not None:
+        content_path = get_response_file_path(response_data["name"], ".body")
+        os.replace(response_data["response_file"], content_path)
+        response_data["response_file"] = content_path
+    json_utility.save(
+        response_data, get_response_file_path(response_data["name"]))
+
+
 def load_response_file(response_name: str) -> dict:
     """
     Function for loading response file.
     :param response_name: Response name.
     :return: Response file content.
     """
-    return json_utility.load(os.path.join(
-        cfg.PATHS.RESPONSE_PATH, f"{response_name}.json"))
+    return json_utility.load(get_response_file_path(response_name))
+
+
+def load_response_content(path: str) -> Any:
+    """
+    Function for loading streamed response content.
+    :param path: Response content path.
+    :return: Response content as JSON data if possible, else as text.
+    """
+    with open(path, "rb") as in_file:
+        content = in_file.read()
+    try:
+        return json_utility.loads(content)
+    except ValueError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _remove_files(paths: List[str]) -> None:
+    """
+    Function for removing files, skipping already missing files.
+    :param paths: File paths.
+    """
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
 
 
 def delete_response_file(response_name: str) -> None:
@@ -73,9 +166,59 @@ def delete_response_file(response_name: str) -> None:
     Function for deleting response file.
     :param response_name: Response name.
     """
-    path = os.path.join(cfg.PATHS.RESPONSE_PATH, f"{response_name}.json")
-    if os.path.exists(path):
-        os.remove(path)
+    _remove_files([get_response_file_path(response_name, extension)
+                   for extension in [".json", ".body"]])
+
+
+def delete_response_files(response_names: List[str]) -> None:
+    """
+    Function for deleting multiple response files in the background.
+    :param response_names: Response names.
+    """
+    if response_names:
+        IO_POOL.submit(_remove_files, [get_response_file_path(response_name, extension)
+                                       for response_name in response_names for extension in [".json", ".body"]])
+
+
+@lru_cache(maxsize=None)
+def get_request_session() -> Any:
+    """
+    Function for acquiring the shared request session.
+    The requests library is only imported on first use.
+    :return: Request session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Pool connections across requests but do not carry cookies over from earlier responses
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    for prefix in ["http://", "https://"]:
+        session.mount(prefix, HTTPAdapter(
+            pool_connections=16, pool_maxsize=32))
+    return session
+
+
+def stream_response_content(response: Any) -> Tuple[str, str]:
+    """
+    Function for streaming response content into a temporary file in the response folder.
+    The temporary file is removed, if streaming fails.
+    :param response: Response, requested in streaming mode.
+    :return: Path of the written file and a text preview of its beginning.
+    """
+    preview = b""
+    file_descriptor, path = tempfile.mkstemp(
+        suffix=".body", dir=cfg.PATHS.RESPONSE_PATH)
+    try:
+        with os.fdopen(file_descriptor, "wb") as out_file:
+            for chunk in response.iter_content(chunk_size=STREAMING_CHUNK_SIZE):
+                if len(preview) < RESPONSE_PREVIEW_SIZE:
+                    preview += chunk[:RESPONSE_PREVIEW_SIZE - len(preview)]
+                out_file.write(chunk)
+    except Exception:
+        _remove_files([path])
+        raise
+    return path, preview.decode("utf-8", errors="replace")
 
 
 def send_request(method: str, url: str, headers: Optional[dict] = None, params: Optional[dict] = None, json_payload: Optional[dict] = None) -> dict:
@@ -90,31 +233,54 @@ def send_request(method: str, url: str, headers: Optional[dict] = None, params:
     :param json_payload: JSON payload.
         Defaults to None.
     :return: Response data.
+        Response content, exceeding the streaming threshold, is written to a file and referenced under "response_file",
+        its beginning is kept under "response_preview".
     """
+    import requests
+
     response_content = {}
+    response_file = None
+    response_preview = None
     response_status = -1
     response_status_message = "An unknown error appeared"
     response_headers = {}
 
     response = None
     try:
-        response = requests_utility.REQUEST_METHODS[method](
+        response = get_request_session().request(
+            method=method,
             url=url,
             params=params,
             headers=headers,
-            json=json_payload
+            json=json_payload,
+            timeout=cfg.REQUEST_TIMEOUT,
+            stream=True
         )
         response_status = response.status_code
-        response_status_message = f"Status description: {status_codes[response_status]}"
+        response_status_message = STATUS_DESCRIPTIONS.get(
+            response_status, f"Status description: unknown ({response_status})")
         response_headers = dict(response.headers)
+        try:
+            content_length = int(response.headers.get("Content-Length", 0))
+        except ValueError:
+            # A malformed Content-Length does not allow for deciding on streaming, so the content is read directly
+            content_length = 0
+        if content_length > cfg.RESPONSE_STREAMING_THRESHOLD:
+            response_content = None
+            response_file, response_preview = stream_response_content(
+                response)
+        else:
+            try:
+                response_content = response.json()
+            except ValueError:
+                response_content = response.text
     except requests.exceptions.RequestException as ex:
+        response_content = {}
+        response_status = -1
         response_status_message = f"Exception '{ex}' appeared.\n\nTrace:{traceback.format_exc()}"
-
-    if response is not None:
-        try:
-            response_content = response.json()
-        except json.decoder.JSONDecodeError:
-            response_content = response.text
+    finally:
+        if response is not None:
+            response.close()
 
     return {
         "request_method": method,
@@ -123,6 +289,8 @@ def send_request(method: str, url: str, headers: Optional[dict] = None, params:
         "request_params": params,
         "request_json_payload": json_payload,
         "response": response_content,
+        "response_file": response_file,
+        "response_preview": response_preview,
         "response_status": response_status,
         "response_status_message": response_status_message,
         "response_headers": response_headers}
@@ -7,28 +7,107 @@
 """
 import json
 import os
+import tempfile
+from typing import Any, Callable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def save(data: dict, path: str) -> None:
+# Mode of newly created files under the current umask, mkstemp only grants access to the owner
+UMASK = os.umask(0)
+os.umask(UMASK)
+FILE_MODE = 0o666 & ~UMASK
+
+
+def serialize(data: dict, default: Callable = None, fast: bool = False) -> bytes:
+    """
+    Function for serializing dict data to the format written by save.
+    :param data: Data as dictionary.
+    :param default: Function for converting otherwise unserializable objects.
+        Defaults to None in which case such objects raise an error.
+    :param fast: Flag for declaring, whether to use orjson if available, which is faster but limited to 64 bit integers and writes NaN and Infinity values as null.
+        Defaults to False in which case the standard json module is used.
+    :return: Serialized data.
+    """
+    if fast and orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=4, ensure_ascii=False, default=default).encode("utf-8")
+
+
+def write(content: bytes, path: str) -> None:
+    """
+    Function for writing serialized data to path.
+    Content is written to a uniquely named temporary file next to the target path first and moved to the target path afterwards.
+    :param content: Serialized data.
+    :param path: Save path.
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        try:
+            out_file = os.fdopen(file_descriptor, "wb")
+        except Exception:
+            os.close(file_descriptor)
+            raise
+        with out_file:
+            out_file.write(content)
+        os.chmod(temporary_path, FILE_MODE)
+        os.replace(temporary_path, path)
+    except Exception:
+        os.remove(temporary_path)
+        raise
+
+
+def save(data: dict, path: str, fast: bool = False) -> None:
     """
     Function for saving dict data to path.
     :param data: Data as dictionary.
     :param path: Save path.
+    :param fast: Flag for declaring, whether to use orjson if available, which is faster but limited to 64 bit integers and writes NaN and Infinity values as null.
+        Defaults to False in which case the standard json module is used.
     """
-    with open(path, "w", encoding="utf-8") as out_file:
-        json.dump(data, out_file, indent=4, ensure_ascii=False)
+    write(serialize(data, fast=fast), path)
 
 
-def load(path: str) -> dict:
+def load(path: str, fast: bool = False) -> dict:
     """
     Function for loading json data from path.
     :param path: Save path.
+    :param fast: Flag for declaring, whether to use orjson if available, which is faster but limited to 64 bit integers and writes NaN and Infinity values as null.
+        Defaults to False in which case the standard json module is used.
     :return: Dictionary containing data.
     """
+    if fast and orjson is not None:
+        with open(path, "rb") as in_file:
+            return orjson.loads(in_file.read())
     with open(path, "r", encoding="utf-8") as in_file:
         return json.load(in_file)
 
 
+def loads(text: str, fast: bool = False) -> Any:
+    """
+    Function for loading json data from text.
+    :param text: Text.
+    :param fast: Flag for declaring, whether to use orjson if available, which is faster but limited to 64 bit integers and writes NaN and Infinity values as null.
+        Defaults to False in which case the standard json module is used.
+    :return: Loaded data.
+    """
+    return orjson.loads(text) if fast and orjson is not None else json.loads(text)
+
+
+def dumps(data: Any, fast: bool = False) -> str:
+    """
+    Function for dumping data to json text.
+    :param data: Data.
+    :param fast: Flag for declaring, whether to use orjson if available, which is faster but limited to 64 bit integers and writes NaN and Infinity values as null.
+        Defaults to False in which case the standard json module is used.
+    :return: Json text.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8") if fast and orjson is not None else json.dumps(data, ensure_ascii=False)
+
+
 def is_json_file(path: str) -> bool:
     """
     Function for checking whether path is json file.
@@ -26,7 +26,7 @@ REQUEST_METHODS = {
 MEDIA_TYPES_PATH = os.path.abspath(os.path.join(
     os.path.dirname(__file__), os.pardir, "data", "media_types.json"))
 if os.path.exists(MEDIA_TYPES_PATH):
-    MEDIA_TYPES = json_utility.load(MEDIA_TYPES_PATH)
+    MEDIA_TYPES = json_utility.load(MEDIA_TYPES_PATH, fast=True)
 else:
     MEDIA_TYPES = {}
 
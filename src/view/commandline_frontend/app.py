@@ -5,7 +5,7 @@
 *            (c) 2024 Alexander Hering             *
 ****************************************************
 """
-from typing import List
+from typing import List, Tuple
 import traceback
 from rich import print as rich_print
 from src.interfaces.frontend_interface import populate_or_get_frontend_cache, save_frontend_cache
@@ -19,7 +19,7 @@ from prompt_toolkit.key_binding.key_bindings import KeyBindings
 from prompt_toolkit.key_binding.key_processor import KeyPressEvent
 
 
-BINDINGS = KeyBindings()
+BOOLEAN_VALUES = {"true": True, "false": False}
 APP_CONFIG = {
     "main_page": {
         "pre_panels": [],
@@ -30,85 +30,6 @@ APP_CONFIG = {
     },
     "error_page": frontend_rendering.get_error_page([RESET_CACHE_AND_RETURN_TO_MAIN])
 }
-CACHE = None
-CLOSE_SESSION = None
-
-
-@BINDINGS.add("c-c")
-@BINDINGS.add("c-d")
-def exit_app(event: KeyPressEvent) -> None:
-    """
-    Function for exiting app.
-    :param event: Event that resulted in entering the function.
-    """
-    global CLOSE_SESSION, CACHE
-
-    CLOSE_SESSION = True
-    if event.key_sequence[0].key.value == "c-d":
-        rich_print("[green bold]Saving cache...")
-        save_frontend_cache(CACHE, ignore=IGNORED_CACHE_FIELDS)
-    rich_print("[bold]\nBye [white]...")
-    event.app.exit()
-
-
-def setup_session() -> PromptSession:
-    """
-    Function for setting up prompt session.
-    :return: Prompt session.
-    """
-    global CLOSE_SESSION, CACHE, BINDINGS
-
-    CACHE = populate_or_get_frontend_cache()
-    CACHE["last_path"] = None
-    CACHE["current_path"] = ["error_page"]
-    CLOSE_SESSION = False
-    return PromptSession(
-        bottom_toolbar=frontend_rendering.get_bottom_toolbar(),
-        style=frontend_rendering.get_style(),
-        auto_suggest=AutoSuggestFromHistory(),
-        key_bindings=BINDINGS
-    )
-
-
-def get_current_state() -> dict:
-    """
-    Function for getting current state config.
-    :return: Current state config.
-    """
-    global CACHE, APP_CONFIG
-
-    CACHE["last_path"] = CACHE["current_path"]
-    if dictionary_utility.exists(APP_CONFIG, CACHE["current_path"]):
-        if len(CACHE["current_path"]) == 0:
-            CACHE["current_path"] = ["main_page"]
-        current_state = dictionary_utility.extract_nested_value(
-            APP_CONFIG, CACHE["current_path"])
-    else:
-        current_state = APP_CONFIG.get("error_page", {})
-    return current_state
-
-
-def handle_step(current_state: dict) -> List[Command]:
-    """
-    Function for handling a loop step.
-    :param current_state: Current state config.
-    :return: List of active commands.
-    """
-    global CACHE
-
-    for panel in current_state.get("pre_panels", []):
-        rich_print(panel)
-    for command in current_state.get("execute", []):
-        command.run_command(cache=CACHE)
-    for panel in current_state.get("post_panels", []):
-        rich_print(panel)
-    commands = current_state.get("commands", [])
-    command_panel = frontend_rendering.get_available_command_panel(
-        commands)
-
-    if command_panel is not None:
-        rich_print(command_panel)
-    return commands
 
 
 def get_completer(commands: List[Command]) -> WordCompleter:
@@ -125,53 +46,188 @@ def get_completer(commands: List[Command]) -> WordCompleter:
     return WordCompleter(completion)
 
 
-def handle_user_input(session: PromptSession, commands: List[Command], prompt: str = None) -> None:
+def parse_user_input(user_input: str) -> Tuple[str, dict]:
+    """
+    Function for parsing user input into command and keyword arguments.
+    :param user_input: User input.
+    :return: Command and keyword arguments.
+    """
+    command, separator, rest = user_input.partition(" --")
+    kwargs = {}
+    while separator:
+        argument, separator, rest = rest.partition(" --")
+        keyword, assignment, value = argument.partition("=")
+        kwargs[keyword] = BOOLEAN_VALUES.get(
+            value.lower(), value) if assignment else True
+    return command, kwargs
+
+
+class FrontendSession(object):
     """
-    Function to handle user input.
-    :param session: Prompt session.
-    :param commands: List of active commands.
-    :param prompt: A specific prompt for prompting for user input.
-        Defaults to None.
+    Class, representing a command line frontend session.
     """
-    global CACHE
-
-    user_input = session.prompt(
-        f"{'' if prompt is None else prompt}> ", completer=get_completer(commands=commands))
-    if user_input is not None:
-        user_input = user_input.split(" --")
-        cmd = user_input[0]
-        cmd_obj = [
-            cmd_obj for cmd_obj in commands if cmd_obj.command == cmd][0]
-        cmd_kwargs = {"cache": CACHE}
-        for index, argument in enumerate(user_input[1:]):
-            if "=" in argument:
-                keyword, value = argument.split("=")
-                cmd_kwargs[keyword] = True if value.lower(
-                ) == "true" else False if value.lower() == "false" else value
-            else:
-                cmd_kwargs[list(cmd_obj.argument_descriptions.keys())[index]
-                           ] = True
-        cmd_obj.run_command(**cmd_kwargs)
+
+    def __init__(self, app_config: dict = None) -> None:
+        """
+        Initiation method.
+        :param app_config: App config.
+            Defaults to None in which case the module level app config is used.
+        """
+        self.app_config = APP_CONFIG if app_config is None else app_config
+        self.cache = None
+        self.close = False
+        self._last_path = None
+        self._last_state = None
+        self._state_resources = {}
+        self.bindings = KeyBindings()
+        self.bindings.add("c-c")(self.exit_app)
+        self.bindings.add("c-d")(self.exit_app)
+
+    def exit_app(self, event: KeyPressEvent) -> None:
+        """
+        Method for exiting app.
+        :param event: Event that resulted in entering the method.
+        """
+        self.close = True
+        if event.key_sequence[0].key.value == "c-d":
+            rich_print("[green bold]Saving cache...")
+            save_frontend_cache(self.cache, ignore=IGNORED_CACHE_FIELDS)
+        rich_print("[bold]\nBye [white]...")
+        event.app.exit()
+
+    def setup_session(self) -> PromptSession:
+        """
+        Method for setting up prompt session.
+        :return: Prompt session.
+        """
+        self.cache = populate_or_get_frontend_cache()
+        self.cache["last_path"] = None
+        self.cache["current_path"] = ["error_page"]
+        self.close = False
+        self._last_path = None
+        self._last_state = None
+        session = PromptSession(
+            bottom_toolbar=frontend_rendering.get_bottom_toolbar(),
+            style=frontend_rendering.get_style(),
+            auto_suggest=AutoSuggestFromHistory(),
+            key_bindings=self.bindings
+        )
+        self.warm_up()
+        return session
+
+    def get_state_resources(self, state: dict) -> dict:
+        """
+        Method for getting the prepared resources of a state.
+        :param state: State config.
+        :return: State resources, containing commands, command index, completer and command panel.
+        """
+        entry = self._state_resources.get(id(state))
+        if entry is None or entry[0] is not state:
+            commands = state.get("commands", [])
+            entry = (state, {
+                "commands": commands,
+                "command_index": {command.command: command for command in commands},
+                "completer": get_completer(commands=commands),
+                "command_panel": frontend_rendering.get_available_command_panel(commands)
+            })
+            self._state_resources[id(state)] = entry
+        return entry[1]
+
+    def warm_up(self) -> None:
+        """
+        Method for preparing the resources of all states in the app config.
+        """
+        to_visit = [self.app_config]
+        while to_visit:
+            data = to_visit.pop()
+            if "commands" in data:
+                self.get_state_resources(data)
+            to_visit.extend(
+                value for value in data.values() if isinstance(value, dict))
+
+    def get_current_state(self) -> dict:
+        """
+        Method for getting current state config.
+        :return: Current state config.
+        """
+        cache = self.cache
+        cache["last_path"] = cache["current_path"]
+        if self._last_state is not None and tuple(cache["current_path"]) == self._last_path:
+            return self._last_state
+        if dictionary_utility.exists(self.app_config, cache["current_path"]):
+            if len(cache["current_path"]) == 0:
+                cache["current_path"] = ["main_page"]
+            current_state = dictionary_utility.extract_nested_value(
+                self.app_config, cache["current_path"])
+        else:
+            current_state = self.app_config.get("error_page", {})
+        self._last_path = tuple(cache["current_path"])
+        self._last_state = current_state
+        return current_state
+
+    def handle_step(self, current_state: dict) -> dict:
+        """
+        Method for handling a loop step.
+        :param current_state: Current state config.
+        :return: Resources of the current state.
+        """
+        print_panel = rich_print
+        cache = self.cache
+        resources = self.get_state_resources(current_state)
+        for panel in current_state.get("pre_panels", []):
+            print_panel(panel)
+        for command in current_state.get("execute", []):
+            command.run_command(cache=cache)
+        for panel in current_state.get("post_panels", []):
+            print_panel(panel)
+
+        if resources["command_panel"] is not None:
+            print_panel(resources["command_panel"])
+        return resources
+
+    def handle_user_input(self, session: PromptSession, resources: dict, prompt: str = None) -> None:
+        """
+        Method to handle user input.
+        :param session: Prompt session.
+        :param resources: Resources of the current state.
+        :param prompt: A specific prompt for prompting for user input.
+            Defaults to None.
+        """
+        user_input = session.prompt(
+            f"{'' if prompt is None else prompt}> ", completer=resources["completer"])
+        if user_input is not None:
+            cmd, cmd_kwargs = parse_user_input(user_input)
+            cmd_obj = resources["command_index"][cmd]
+            cmd_kwargs["cache"] = self.cache
+            cmd_obj.run_command(**cmd_kwargs)
+
+    def run_session_loop(self) -> None:
+        """
+        Method for running the session loop.
+        """
+        session = self.setup_session()
+        cache = self.cache
+        get_current_state = self.get_current_state
+        handle_step = self.handle_step
+        handle_user_input = self.handle_user_input
+        while not self.close:
+            current_state = get_current_state()
+            try:
+                resources = handle_step(current_state=current_state)
+                handle_user_input(session=session,
+                                  resources=resources,
+                                  prompt=current_state.get("prompt"))
+            except Exception as ex:
+                print(ex)
+                print(traceback.format_exc())
+                cache["current_path"] = ["error_page"]
 
 
 def run_session_loop() -> None:
     """
     Command line interface for Image Generation resource handling.
     """
-    global CLOSE_SESSION, CACHE
-
-    session = setup_session()
-    while not CLOSE_SESSION:
-        current_state = get_current_state()
-        try:
-            commands = handle_step(current_state=current_state)
-            handle_user_input(session=session,
-                              commands=commands,
-                              prompt=current_state.get("prompt"))
-        except Exception as ex:
-            print(ex)
-            print(traceback.format_exc())
-            CACHE["current_path"] = ["error_page"]
+    FrontendSession().run_session_loop()
 
 
 """
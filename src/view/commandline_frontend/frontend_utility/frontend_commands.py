@@ -7,8 +7,8 @@
 """
 import os
 from typing import Optional, Any, Callable, Dict
-import copy
 import traceback
+from functools import partial
 from src.interfaces.frontend_interface import populate_or_get_frontend_cache, dump_frontend_cache
 from src.view.commandline_frontend.frontend_utility.coloring import RichColors
 
@@ -36,9 +36,14 @@ class Command(object):
         self.function = function
         self.argument_descriptions = argument_descriptions
         self.default_kwargs = {} if default_kwargs is None else default_kwargs
-        self.help_text = f"[{RichColors.commands}]No help text available for '[{RichColors.command}]{command}[{RichColors.commands}]'" if help_text is None else help_text
+        self._call = partial(
+            function, **self.default_kwargs) if self.default_kwargs else function
+        command_color = RichColors.command
+        commands_color = RichColors.commands
+        self.help_text = f"[{commands_color}]No help text available for '[{command_color}]{command}[{commands_color}]'" if help_text is None else help_text
         for keyword in argument_descriptions:
-            self.help_text += f"\n    [{RichColors.command}]--{keyword}[{RichColors.commands}]: {argument_descriptions[keyword]}"
+            self.help_text += f"\n    [{command_color}]--{keyword}[{commands_color}]: {argument_descriptions[keyword]}"
+        self.panel_line = f"[{command_color} bold]{command}[/][{commands_color}]: {self.help_text}"
 
     def run_command(self, **kwargs: Optional[Any]) -> bool:
         """
@@ -47,10 +52,7 @@ class Command(object):
         :return: True if function call was successful else False.
         """
         try:
-            current_kwargs = copy.deepcopy(self.default_kwargs)
-            if kwargs:
-                current_kwargs.update(kwargs)
-            self.function(**current_kwargs)
+            self._call(**kwargs)
             return True
         except Exception as ex:
             print(f"Exception {ex} appeared.\nTrace:{traceback.format_exc()}")
@@ -7,6 +7,7 @@
 """
 from typing import List, Optional
 from rich.panel import Panel
+import sys
 import traceback
 from rich.style import Style as RichStyle
 from prompt_toolkit.styles import Style as PTStyle
@@ -14,23 +15,34 @@ from src.view.commandline_frontend.frontend_utility.coloring import RichColors
 from src.view.commandline_frontend.frontend_utility.frontend_commands import Command
 
 
+COMMAND_USAGE_TEXT = f"[{RichColors.commands}]Command usage: [{RichColors.command}]<CMD>[{RichColors.commands}] " \
+    f"--[{RichColors.command}]<FLAG>[{RichColors.commands}]... --[{RichColors.command}]<ARGUMENT>[{RichColors.commands}]=[{RichColors.value}]<VALUE>[{RichColors.commands}]...\n\n"
+BOTTOM_TOOLBAR = [
+    ("class:bottom-toolbar",
+     "ctl-c to exit, ctl-d to save cache and exit",)
+]
+STYLE = PTStyle.from_dict({
+    "bottom-toolbar": "#333333 bg:#ffcc00"
+})
+
+
 def get_error_page(commands: List[Command]) -> dict:
     """
     Function for acquiring error page.
     :param commands: List of commands.
     :return: Error page structure.
     """
-    trace = traceback.format_exc()
-    if trace == "NoneType: None\n":
-        content = f"[{RichColors.error}] An error appeared."
+    error_color = RichColors.error
+    if sys.exc_info()[0] is None:
+        content = f"[{error_color}] An error appeared."
     else:
-        content = f"[{RichColors.error}]{trace}"
+        content = f"[{error_color}]{traceback.format_exc()}"
 
     return {
         "pre_panels": [],
         "execute": [],
-        "post_panels": [Panel(f"{content}", title=f"[{RichColors.error} bold]Error",
-                              border_style=RichStyle(color=RichColors.error))],
+        "post_panels": [Panel(f"{content}", title=f"[{error_color} bold]Error",
+                              border_style=RichStyle(color=error_color))],
         "commands": commands,
         "prompt": ""
     }
@@ -42,9 +54,11 @@ def get_available_command_panel(available_commands: List[Command] = None) -> Opt
     :param available_commands: List of available commands.
     :return: Panel, containing available commands, if there are any.
     """
-    usage_text = f"[{RichColors.commands}]Command usage: [{RichColors.command}]<CMD>[{RichColors.commands}] "
-    usage_text += f"--[{RichColors.command}]<FLAG>[{RichColors.commands}]... --[{RichColors.command}]<ARGUMENT>[{RichColors.commands}]=[{RichColors.value}]<VALUE>[{RichColors.commands}]...\n\n"
-    return Panel(usage_text + "\n".join([f"[{RichColors.command} bold]{cmd.command}[/][{RichColors.commands}]: {cmd.help_text}" for cmd in available_commands]), title=f"[{RichColors.commands} bold]Commands", border_style=RichStyle(color=RichColors.commands)) if available_commands else None
+    if not available_commands:
+        return None
+    commands_color = RichColors.commands
+    return Panel(COMMAND_USAGE_TEXT + "\n".join(cmd.panel_line for cmd in available_commands),
+                 title=f"[{commands_color} bold]Commands", border_style=RichStyle(color=commands_color))
 
 
 def get_bottom_toolbar() -> str:
@@ -52,10 +66,7 @@ def get_bottom_toolbar() -> str:
     Function for getting bottom toolbar.
     :return: String for building bottom toolbar.
     """
-    return [
-        ("class:bottom-toolbar",
-         "ctl-c to exit, ctl-d to save cache and exit",)
-    ]
+    return BOTTOM_TOOLBAR
 
 
 def get_style() -> PTStyle:
@@ -63,6 +74,4 @@ def get_style() -> PTStyle:
     Function for getting style.
     :return: Style.
     """
-    return PTStyle.from_dict({
-        "bottom-toolbar": "#333333 bg:#ffcc00"
-    })
+    return STYLE
@@ -5,23 +5,43 @@
 *            (c) 2023 Alexander Hering             *
 ****************************************************
 """
-import os
-import json
 from urllib.parse import urlparse
 from typing import Any, List
 import streamlit as st
 from src.configuration import configuration as cfg
-from src.interfaces.frontend_interface import send_request
+from src.interfaces.frontend_interface import send_request, save_response_file, delete_response_files
 from src.utility.bronze import json_utility, time_utility
 from src.view.streamlit_frontend.frontend_utility.state_cache_handling import populate_state_cache
 from src.view.streamlit_frontend.frontend_utility.frontend_rendering import render_request_input_form, render_response_data, render_sidebar_control_header, render_sidebar_response_list
 
 
+REQUEST_INPUT_FIELDS = (
+    ("headers", "headers_update"),
+    ("params", "params_update"),
+    ("json_payload", "json_payload_update")
+)
+
+
 ###################
 # Main app functionality
 ###################
 
 
+def get_url_netloc(url: str) -> str:
+    """
+    Function for acquiring the network location of an URL.
+    Plain http(s) URLs are split directly, others are parsed.
+    :param url: URL.
+    :return: Network location.
+    """
+    if url.startswith(("http://", "https://")):
+        netloc = url.split("//", 1)[1]
+        for separator in "/?#":
+            netloc = netloc.partition(separator)[0]
+        return netloc
+    return urlparse(url).netloc
+
+
 def prepare_request_input() -> dict:
     """
     Function for preparing request input.
@@ -31,10 +51,10 @@ def prepare_request_input() -> dict:
         "url": st.session_state["url_update"],
         "method": st.session_state["method_update"]
     }
-    for field in ["headers", "params", "json_payload"]:
+    for field, update_field in REQUEST_INPUT_FIELDS:
         try:
-            kwargs[field] = json.loads(
-                st.session_state[f"{field}_update"]["text"])
+            kwargs[field] = json_utility.loads(
+                st.session_state[update_field]["text"])
         except Exception:
             kwargs[field] = None
     return kwargs
@@ -45,24 +65,25 @@ def handle_response_data(response_data: dict) -> None:
     Function for handling response data after request.
     :param response_data: Gathered response data.
     """
+    cache = st.session_state["CACHE"]
+    responses = cache["responses"]
+
     # Keep only the allowed number of responses
-    while len(st.session_state["CACHE"]["responses"]) >= cfg.KEEP_RESPONSES:
-        to_remove = st.session_state["CACHE"]["responses"].pop(
-            list(st.session_state["CACHE"]["responses"].keys())[0])
-        path = os.path.join(cfg.PATHS.RESPONSE_PATH,
-                            f"{to_remove['name']}.json")
-        if os.path.exists(path):
-            os.remove(path)
+    evicted = []
+    while len(responses) >= cfg.KEEP_RESPONSES:
+        evicted.append(responses.popitem(last=False)[1]["name"])
+    delete_response_files(evicted)
 
     # Create individual name
-    response_name = f"{time_utility.get_timestamp()}_STATUS{response_data['response_status']}_{urlparse(response_data['request_url']).netloc}"
+    response_name = f"{time_utility.get_timestamp()}_STATUS{response_data['response_status']}_{get_url_netloc(response_data['request_url'])}"
     response_data["name"] = response_name
 
-    # Save response to disk and cache
-    json_utility.save(response_data, os.path.join(cfg.PATHS.RESPONSE_PATH,
-                      f"{response_name}.json"))
-    st.session_state["CACHE"]["responses"][response_name] = response_data
-    st.session_state["CACHE"]["current_response"] = response_name
+    # Save response to disk and keep only its metadata in cache
+    save_response_file(response_data)
+    response_data.pop("response")
+    responses[response_name] = response_data
+    cache["current_response"] = response_name
+    st.session_state["cache_dirty"] = True
 
 
 ###################
@@ -83,11 +104,7 @@ if __name__ == "__main__":
         populate_state_cache()
         st.rerun()
     column_splitter_kwargs = {"spec": [0.5, 0.5], "gap": "medium"}
-    data = {key: val for key, val in st.session_state['CACHE'].items(
-    ) if key in ["method", "url", "headers", "params", "json_payload"]}
-    data.update({key: val for key, val in st.session_state.items(
-    ) if key.endswith("update")})
-    print(f"Running with {data}")
+
     # Main page
     st.title("API Workbench")
     render_sidebar_control_header()
@@ -105,4 +122,7 @@ if __name__ == "__main__":
 
     render_response_data(right)
     render_sidebar_response_list()
-    st.json(dict(st.session_state))
+    if cfg.FRONTEND_DEBUG:
+        with st.expander("Session state (debug)"):
+            st.code(json_utility.serialize({key: value for key, value in st.session_state.items()
+                                            if key != "CACHE"}, default=str).decode("utf-8"), language="json")
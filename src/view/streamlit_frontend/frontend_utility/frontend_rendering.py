@@ -5,15 +5,52 @@
 *            (c) 2023 Alexander Hering             *
 ****************************************************
 """
-import copy
-import json
-from typing import Any, List
+from typing import Any, List, Optional
+from functools import lru_cache
 import streamlit as st
 
 from code_editor import code_editor
-from src.utility.bronze import requests_utility
-from src.interfaces.frontend_interface import populate_or_get_frontend_cache, save_frontend_cache
-from src.view.streamlit_frontend.frontend_utility.state_cache_handling import update_state_cache, delete_response, reload_request
+from src.configuration import configuration as cfg
+from src.utility.bronze import requests_utility, json_utility
+from src.interfaces.frontend_interface import save_frontend_cache_in_background, load_response_content
+from src.view.streamlit_frontend.frontend_utility.state_cache_handling import load_state_cache, check_state_cache_save, is_state_cache_saved, get_response_file_modification_time, load_cached_response_file, update_state_cache, delete_response, reload_request
+
+
+REQUEST_METHODS = tuple(requests_utility.REQUEST_METHODS)
+JSON_EDITOR_BUTTONS = [
+    {
+        "name": "save",
+        "feather": "Save",
+        "hasText": True,
+        "alwaysOn": True,
+        "commands": [
+                "save-state",
+                [
+                    "response",
+                    "saved"
+                ]
+        ],
+        "response": "saved",
+        "style": {"top": "0rem", "right": "9.6rem"}
+    },
+    {
+        "name": "copy",
+        "feather": "Copy",
+        "hasText": True,
+        "alwaysOn": True,
+        "commands": ["copyAll"],
+        "style": {"top": "0rem", "right": "5rem"}
+    },
+    {
+        "name": "clear",
+        "feather": "X",
+        "hasText": True,
+        "alwaysOn": True,
+        "commands": ["selectall", "del", ["insertstring", "{\n\n\n\n}"], "save-state",
+                     ["response", "saved"]],
+        "style": {"top": "0rem", "right": "0.4rem"}
+    },
+]
 
 
 ###################
@@ -21,6 +58,7 @@ from src.view.streamlit_frontend.frontend_utility.state_cache_handling import up
 ###################
 
 
+@lru_cache(maxsize=4 * cfg.KEEP_RESPONSES)
 def convert_response_name_to_label(response_name: str) -> str:
     """
     Function for converting response name to a label text.
@@ -41,45 +79,43 @@ def convert_response_name_to_label(response_name: str) -> str:
     return f"{time_text}\n\nStatus: {status_text}  ... {mail} \n\n {url_text if url_text else '<unkown>'}"
 
 
+@st.cache_data(max_entries=2 * cfg.KEEP_RESPONSES, show_spinner=False)
+def get_serialized_response_field(response_name: str, modification_time: Optional[float], field: str, _content: Any) -> str:
+    """
+    Function for acquiring a serialized response field for rendering.
+    Results are cached by response name, response file modification time and field, the content itself is not hashed.
+    :param response_name: Response name.
+    :param modification_time: Modification time of the response file, None for responses without file.
+    :param field: Response field.
+    :param _content: Field content.
+    :return: Serialized field content.
+    """
+    return json_utility.dumps(_content)
+
+
+def get_json_editor_text(cache_field: str, content: Any) -> str:
+    """
+    Function for acquiring the code editor text of a state cache field.
+    The text is kept in the session state and only rebuilt when the field is replaced.
+    :param cache_field: State cache field.
+    :param content: State cache field content.
+    :return: Code editor text.
+    """
+    text_key = f"{cache_field}_editor_text"
+    cached = st.session_state.get(text_key)
+    if cached is None or cached[0] is not content:
+        cached = (content, json_utility.dumps({} if content is None else content).replace(
+            "{", "{\n\n").replace("}", "\n\n}"))
+        st.session_state[text_key] = cached
+    return cached[1]
+
+
 def get_json_editor_buttons() -> List[dict]:
     """
     Function for acquiring json payload code editor buttons.
     :return: Buttons as list of dictionaries.
     """
-    return [
-        {
-            "name": "save",
-            "feather": "Save",
-            "hasText": True,
-            "alwaysOn": True,
-            "commands": [
-                    "save-state",
-                    [
-                        "response",
-                        "saved"
-                    ]
-            ],
-            "response": "saved",
-            "style": {"top": "0rem", "right": "9.6rem"}
-        },
-        {
-            "name": "copy",
-            "feather": "Copy",
-            "hasText": True,
-            "alwaysOn": True,
-            "commands": ["copyAll"],
-            "style": {"top": "0rem", "right": "5rem"}
-        },
-        {
-            "name": "clear",
-            "feather": "X",
-            "hasText": True,
-            "alwaysOn": True,
-            "commands": ["selectall", "del", ["insertstring", "{\n\n\n\n}"], "save-state",
-                         ["response", "saved"]],
-            "style": {"top": "0rem", "right": "0.4rem"}
-        },
-    ]
+    return JSON_EDITOR_BUTTONS
 
 
 ###################
@@ -91,20 +127,28 @@ def render_sidebar_control_header() -> None:
     """
     Function for rendering the sidebar control header.
     """
+    check_state_cache_save()
     sidebar_left, sidebar_right = st.sidebar.columns([0.5, 0.5])
     if sidebar_right.button(":floppy_disk: Save state"):
-        with st.spinner("Saving State..."):
-            save_frontend_cache(st.session_state["CACHE"])
+        if is_state_cache_saved():
+            st.toast("State is already saved.")
+        else:
+            st.session_state["cache_save"] = save_frontend_cache_in_background(
+                st.session_state["CACHE"])
+            st.session_state["cache_dirty"] = False
+            st.toast("Saving state...")
     if sidebar_left.button(":cd: Clear state"):
         with st.spinner("Clearing State..."):
-            st.session_state["CACHE"] = populate_or_get_frontend_cache(
+            st.session_state["CACHE"] = load_state_cache(
                 force_default=True)
+            st.session_state["cache_dirty"] = True
     if sidebar_left.button("Reload workbench"):
         st.rerun()
+    responses = st.session_state["CACHE"]["responses"]
     if st.sidebar.button(":wastebasket: Delete all responses",
-                         disabled=len(st.session_state["CACHE"]["responses"]) < 2):
+                         disabled=len(responses) < 2):
         with st.spinner("Deleting responses..."):
-            for response_name in list(st.session_state["CACHE"]["responses"].keys()):
+            for response_name in list(responses):
                 if response_name != "default":
                     delete_response(response_name)
         st.rerun()
@@ -144,8 +188,7 @@ def render_json_input(parent_widget: Any, cache_field: str) -> None:
     parent_widget.text(
         """(CTRL+ENTER or "save" to confirm)""")
     with parent_widget.empty():
-        content = st.session_state["CACHE"].get(cache_field)
-        code_editor(json.dumps({} if content is None else content).replace("{", "{\n\n").replace("}", "\n\n}"),
+        code_editor(get_json_editor_text(cache_field, st.session_state["CACHE"].get(cache_field)),
                     key=f"{cache_field}_update",
                     lang="json",
                     allow_reset=True,
@@ -177,8 +220,7 @@ def render_request_input_form(parent_widget: Any) -> Any:
 
     sending_line_left.selectbox("Method",
                                 key="method_update",
-                                options=list(
-                                    requests_utility.REQUEST_METHODS.keys()),
+                                options=REQUEST_METHODS,
                                 index=0)
     sending_line_middle.text_input("URL",
                                    key="url_update")
@@ -204,27 +246,49 @@ def render_response_data(parent_widget: Any) -> None:
     Function for rendering response data.
     :param parent_widget: Parent widget.
     """
-    data_rendering_spinner = parent_widget.empty()
-    response_status = parent_widget.empty()
-    response_status_message = parent_widget.empty()
+    cache = st.session_state["CACHE"]
+    response_name = cache["current_response"]
+    data = cache["responses"][response_name]
+    modification_time = get_response_file_modification_time(response_name)
+
+    parent_widget.subheader(
+        f"Response Status {data['response_status']}")
+    parent_widget.write(
+        data["response_status_message"])
     parent_widget.divider()
     parent_widget.markdown("##### Response Header: ")
-    response_headers = parent_widget.empty()
+    parent_widget.json(get_serialized_response_field(
+        response_name, modification_time, "response_headers", data["response_headers"]))
     parent_widget.markdown("##### Response Content: ")
-    response = parent_widget.empty()
-
-    # TODO: Check rendering spinner -> seems to have no effect
-    with data_rendering_spinner, st.spinner("Rendering data ..."):
-        data = st.session_state["CACHE"]["responses"][st.session_state["CACHE"]
-                                                      ["current_response"]]
-        response_status.subheader(
-            f"Response Status {data['response_status']}")
-        response_status_message.write(
-            data["response_status_message"])
-        response_headers.json(
-            data["response_headers"])
-
-        if isinstance(data["response"], dict):
-            response.json(data["response"])
-        else:
-            response.write(data["response"])
+
+    if "response" in data:
+        content = data["response"]
+    else:
+        response_file = load_cached_response_file(
+            response_name, modification_time)
+        if response_file is None:
+            parent_widget.warning(
+                f"Response file of '{response_name}' is missing.")
+            return
+        content = response_file["response"]
+    if isinstance(content, dict):
+        parent_widget.json(get_serialized_response_field(
+            response_name, modification_time, "response", content))
+    elif content is None and data.get("response_file"):
+        parent_widget.write(
+            f"Response content was written to '{data['response_file']}'.")
+        if data.get("response_preview"):
+            parent_widget.code(data["response_preview"], language=None)
+        if parent_widget.button("Load response content", key=f"load_{response_name}"):
+            try:
+                content = load_response_content(data["response_file"])
+            except FileNotFoundError:
+                parent_widget.warning(
+                    f"Response content file '{data['response_file']}' is missing.")
+                return
+            if isinstance(content, dict):
+                parent_widget.json(content)
+            else:
+                parent_widget.write(content)
+    else:
+        parent_widget.write(content)
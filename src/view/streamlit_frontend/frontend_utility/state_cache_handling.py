@@ -5,9 +5,90 @@
 *            (c) 2023 Alexander Hering             *
 ****************************************************
 """
+import os
 import streamlit as st
-from typing import List, Any
-from src.interfaces.frontend_interface import populate_or_get_frontend_cache, delete_response_file, load_response_file
+from typing import List, Any, Optional
+from collections import OrderedDict
+from src.configuration import configuration as cfg
+from src.interfaces.frontend_interface import get_frontend_cache_path, get_response_file_path, delete_response_file, load_response_file
+from src.utility.bronze import json_utility
+
+
+REQUEST_UPDATE_FIELDS = {
+    "method_update": "request_method",
+    "url_update": "request_url"
+}
+EDITOR_UPDATE_FIELDS = ("headers_update", "params_update", "json_payload_update")
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def load_cache_file(path: str, modification_time: float) -> dict:
+    """
+    Function for loading a cache file.
+    Results are cached by path and modification time, each call receives its own copy.
+    :param path: Cache file path.
+    :param modification_time: Modification time of the cache file.
+    :return: Cache file content.
+    """
+    return json_utility.load(path)
+
+
+@st.cache_data(max_entries=2 * cfg.KEEP_RESPONSES, show_spinner=False)
+def load_response_file_content(response_name: str, modification_time: float) -> dict:
+    """
+    Function for loading a response file.
+    Results are cached by response name and modification time, each call receives its own copy.
+    :param response_name: Response name.
+    :param modification_time: Modification time of the response file.
+    :return: Response file content.
+    """
+    return load_response_file(response_name)
+
+
+def get_response_file_modification_time(response_name: str) -> Optional[float]:
+    """
+    Function for acquiring the modification time of a response file.
+    :param response_name: Response name.
+    :return: Modification time of the response file or None, if the response has no file.
+    """
+    try:
+        return os.path.getmtime(get_response_file_path(response_name))
+    except FileNotFoundError:
+        return None
+
+
+def load_cached_response_file(response_name: str, modification_time: float = None) -> Optional[dict]:
+    """
+    Function for loading a response file through the response file cache.
+    Response files are deleted independently of saved state caches, so a missing file is not treated as an error.
+    :param response_name: Response name.
+    :param modification_time: Modification time of the response file.
+        Defaults to None in which case it is looked up.
+    :return: Response file content or None, if the response file is missing.
+    """
+    try:
+        if modification_time is None:
+            modification_time = os.path.getmtime(
+                get_response_file_path(response_name))
+        return load_response_file_content(response_name, modification_time)
+    except FileNotFoundError:
+        return None
+
+
+def load_state_cache(force_default: bool = False) -> dict:
+    """
+    Function for loading a state cache.
+    Responses are kept in insertion order for evicting the oldest responses first.
+    The source file and its modification time are remembered for detecting unsaved states.
+    :param force_default: Flag for declaring, whether to force loading the default cache.
+    :return: State cache.
+    """
+    path = get_frontend_cache_path(force_default=force_default)
+    modification_time = os.path.getmtime(path)
+    st.session_state["cache_file"] = (path, modification_time)
+    cache = load_cache_file(path, modification_time)
+    cache["responses"] = OrderedDict(cache["responses"])
+    return cache
 
 
 def populate_state_cache() -> None:
@@ -15,7 +96,43 @@ def populate_state_cache() -> None:
     Function for populating state cache.
     """
     with st.spinner("Loading State..."):
-        st.session_state["CACHE"] = populate_or_get_frontend_cache()
+        st.session_state["CACHE"] = load_state_cache()
+        st.session_state["cache_dirty"] = False
+
+
+def check_state_cache_save() -> None:
+    """
+    Function for checking the outcome of the last background save of the state cache.
+    A failed save marks the state cache as unsaved again and is reported in the sidebar.
+    """
+    future = st.session_state.get("cache_save")
+    if future is None or not future.done():
+        return
+    st.session_state.pop("cache_save")
+    exception = future.exception()
+    if exception is None:
+        st.session_state["cache_file"] = (
+            cfg.PATHS.FRONTEND_CACHE, future.result())
+    else:
+        st.session_state["cache_dirty"] = True
+        st.sidebar.error(f"Saving state failed: {exception}")
+
+
+def is_state_cache_saved() -> bool:
+    """
+    Function for checking whether the state cache matches the frontend cache file.
+    This is the case, if the state cache is unchanged since it was loaded from or saved to the frontend cache file
+    and the file was not modified since.
+    :return: True if the state cache is saved, else False.
+    """
+    if st.session_state.get("cache_dirty", True):
+        return False
+    path, modification_time = st.session_state.get(
+        "cache_file", (None, None))
+    try:
+        return path == cfg.PATHS.FRONTEND_CACHE and os.path.getmtime(path) == modification_time
+    except OSError:
+        return False
 
 
 def update_state_cache(update: dict) -> None:
@@ -23,8 +140,8 @@ def update_state_cache(update: dict) -> None:
     Function for updating state cache.
     :param update: State update.
     """
-    for key in update:
-        st.session_state["CACHE"][key] = update[key]
+    st.session_state["CACHE"].update(update)
+    st.session_state["cache_dirty"] = True
 
 
 def remove_state_cache_element(field_path: List[Any]) -> None:
@@ -32,12 +149,11 @@ def remove_state_cache_element(field_path: List[Any]) -> None:
     Function for removing a target element from cache.
     :param field_path: Field path for traversing cache to target element.
     """
-    target = field_path[-1]
-    field_path.remove(target)
     data = st.session_state["CACHE"]
-    for key in field_path:
+    for key in field_path[:-1]:
         data = data[key]
-    data.pop(target)
+    data.pop(field_path[-1])
+    st.session_state["cache_dirty"] = True
 
 
 def delete_response(response_name: str) -> None:
@@ -56,9 +172,10 @@ def delete_response(response_name: str) -> None:
 def reload_request(response_name: str) -> None:
     """
     Function for deleting a response.
+    The request data is taken from the state cache entry, which keeps it even if the response file is missing.
     :param response_name: Target response name.
     """
-    data = load_response_file(response_name)
+    data = st.session_state["CACHE"]["responses"][response_name]
 
     update_state_cache({
         "current_response": response_name,
@@ -66,8 +183,7 @@ def reload_request(response_name: str) -> None:
         "params": data["request_params"],
         "json_payload": data["request_json_payload"]
     })
-    for field in ["method_update", "url_update"]:
-        request_field = "request_" + "_".join(field.split("_")[:-1])
+    for field, request_field in REQUEST_UPDATE_FIELDS.items():
         st.session_state[field] = data[request_field]
-    for field in ["headers_update", "params_update", "json_payload_update"]:
+    for field in EDITOR_UPDATE_FIELDS:
         st.session_state.pop(field)